@@ -1,11 +1,277 @@
+import functools
+import collections
+import threading
+import time
+import orjson
 import requests
 from requests.sessions import Session
 import streamlit as st
-from typing import Dict, Union, List, Any
+from typing import Dict, Iterator, Optional, OrderedDict, Union, List, Any
 from streamlit.connections import ExperimentalBaseConnection
-import json
 import pandas as pd
-from requests.exceptions import HTTPError
+from requests.exceptions import (
+    ConnectionError,
+    HTTPError,
+    RequestException,
+    RetryError,
+    Timeout,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Cache policies in seconds: short for live issue data, normal for searches and
+# long for rarely changing resources such as the project list.
+TTL_SHORT = 10
+TTL_NORMAL = 30
+TTL_LONG = 3600
+
+# Adaptive ttl: slow requests move up to the smallest tier covering
+# `elapsed * TTL_FACTOR + TTL_BUFFER` seconds, at most TTL_NORMAL so issue data
+# is never held for long. Only tier values are used so the number of response
+# caches stays fixed.
+TTL_ADAPTIVE_TIERS = (TTL_SHORT, TTL_NORMAL)
+TTL_FACTOR = 10
+TTL_BUFFER = 5
+
+# Last measured response time in seconds, keyed by request (see `_request_key`)
+# (LRU, bounded by ELAPSED_MAX_ENTRIES)
+ELAPSED_MAX_ENTRIES = 256
+_elapsed: OrderedDict[tuple, float] = collections.OrderedDict()
+_elapsed_lock = threading.Lock()
+
+# Last successful response per request, served when Jira is down or rate-limited
+# (LRU, keyed by user and request, bounded by STALE_MAX_ENTRIES). Responses are
+# stored serialized so callers mutating their results cannot change them.
+STALE_MAX_ENTRIES = 256
+_stale: OrderedDict[tuple, tuple] = collections.OrderedDict()
+_stale_lock = threading.Lock()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that spaces requests according to Jira's rate-limit headers.
+
+    After each response the minimum interval between requests is set to
+    `x-ratelimit-interval-seconds / x-ratelimit-fillrate`, and a 429 response
+    blocks further requests for `retry-after` seconds.
+
+    Only the final response of each `send` is seen: retries made by urllib3
+    inside `super().send()` are spaced by its own backoff and `retry-after`
+    handling, not by `_min_interval`. This relies on `raise_on_status=False`
+    so that a 429 surviving all retries is returned rather than raised.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.Lock()
+        self._next_ok_at = time.monotonic()
+        self._min_interval = 0.0
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_ok_at - now
+            self._next_ok_at = max(now, self._next_ok_at) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+        response = None
+        try:
+            response = super().send(request, **kwargs)
+            return response
+        finally:
+            if response is not None:
+                self._update_limits(response)
+
+    def _update_limits(self, response):
+        headers = response.headers
+        with self._lock:
+            try:
+                interval = float(headers["x-ratelimit-interval-seconds"])
+                fillrate = float(headers["x-ratelimit-fillrate"])
+                if fillrate > 0:
+                    self._min_interval = interval / fillrate
+            except (KeyError, ValueError):
+                pass
+            if response.status_code == 429:
+                try:
+                    retry_after = float(headers["retry-after"])
+                except (KeyError, ValueError):
+                    return
+                self._next_ok_at = max(
+                    self._next_ok_at, time.monotonic() + retry_after
+                )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_session(base_url: str, username: str, password: str) -> Session:
+    """
+    Builds an authenticated requests.Session shared across all users, sessions and reruns.
+
+    Parameters:
+        base_url (str): The base URL of the Jira instance, used as part of the cache key.
+        username (str): The Jira username.
+        password (str): The Jira password or API token.
+
+    Returns:
+        Session: A requests.Session with authentication credentials, a pooled
+                 RateLimitedAdapter with retries and JSON/gzip default headers.
+    """  # noqa: E501
+    session = requests.Session()
+    session.auth = (username, password)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Searches are POSTs but read-only, so they are safe to retry
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        respect_retry_after_header=True,
+        # Return the last response so raise_for_status() raises HTTPError
+        # instead of urllib3 raising RetryError
+        raise_on_status=False,
+    )
+    adapter = RateLimitedAdapter(
+        pool_connections=10, pool_maxsize=50, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"Accept": "application/json", "Accept-Encoding": "gzip,deflate"}
+    )
+    return session
+
+
+def _send(
+    session: Session,
+    method: str,
+    url: str,
+    params: Dict[str, Any] = None,
+    payload: Dict[str, Any] = None,
+) -> Any:
+    """
+    Sends a single request to the Jira API and returns the decoded JSON body.
+
+    Raises:
+        HTTPError: If the response status is not 2xx.
+    """
+    response = session.request(method, url, params=params, json=payload)
+    response.raise_for_status()  # Raise an error if the request fails
+    key = _request_key(method, url, params, payload)
+    _lru_set(
+        _elapsed,
+        _elapsed_lock,
+        key,
+        response.elapsed.total_seconds(),
+        ELAPSED_MAX_ENTRIES,
+    )
+    return _json(response)
+
+
+def _lru_set(cache: OrderedDict, lock, key, value, max_entries: int):
+    """Stores `value` as the most recent entry of `cache`, evicting the oldest past `max_entries`."""  # noqa: E501
+    with lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > max_entries:
+            cache.popitem(last=False)
+
+
+def _json(response: requests.Response) -> Any:
+    """Decodes a JSON response body with orjson, which is faster than `response.json()`."""  # noqa: E501
+    return orjson.loads(response.content)
+
+
+def _request_key(
+    method: str,
+    url: str,
+    params: Dict[str, Any] = None,
+    payload: Dict[str, Any] = None,
+) -> tuple:
+    """Returns a hashable key identifying a request by method, url, params and payload."""  # noqa: E501
+    # Empty params and payloads are sent as None, so key them the same way
+    return (
+        method,
+        url,
+        orjson.dumps(params or None, option=orjson.OPT_SORT_KEYS),
+        orjson.dumps(payload or None, option=orjson.OPT_SORT_KEYS),
+    )
+
+
+def _adaptive_ttl(key: tuple, ttl: Optional[int]) -> Optional[int]:
+    """
+    Extends `ttl` for requests that were slow to respond.
+
+    The result is always `ttl` or one of TTL_ADAPTIVE_TIERS, since each distinct
+    ttl is a separate response cache.
+    """
+    elapsed = _elapsed.get(key)
+    # ttl=None never expires, so there is nothing to extend
+    if elapsed is None or ttl is None:
+        return ttl
+    adaptive = elapsed * TTL_FACTOR + TTL_BUFFER
+    tiers = TTL_ADAPTIVE_TIERS
+    tier = next((tier for tier in tiers if tier >= adaptive), tiers[-1])
+    return max(ttl, tier)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_send(ttl: Optional[int]):
+    """
+    Returns a `st.cache_data` wrapped version of `_send` for the given ttl.
+
+    The wrapper is built once per ttl so Streamlit sees a stable function object,
+    and each ttl gets its own cache instead of resetting a shared one. Only the
+    user name and the precomputed `params_key` and `payload_key` are hashed; the
+    session and the payload dict are passed through unhashed. The user name keeps
+    responses from being shared between users with different Jira permissions. The cached value is a
+    `(fetched_at, data)` tuple recording when Jira was actually called.
+    """
+
+    def _query(
+        _session: Session,
+        username: str,
+        method: str,
+        url: str,
+        params_key: tuple,
+        payload_key: bytes,
+        _payload: Dict[str, Any] = None,
+    ):
+        data = _send(_session, method, url, dict(params_key) or None, _payload)
+        return time.time(), data
+
+    _query.__qualname__ = f"_cached_send_{ttl}"
+    return st.cache_data(ttl=ttl, show_spinner=False)(_query)
+
+
+def _field_value(value: Any) -> Any:
+    """
+    Returns the display value of a Jira issue field.
+
+    Object fields such as status or assignee are reduced to their display name,
+    other values are returned unchanged.
+    """
+    if isinstance(value, dict):
+        for key in ("displayName", "name", "value"):
+            if key in value:
+                return value[key]
+    return value
+
+
+def _jql_string(value: str) -> str:
+    """Quotes `value` as a JQL string literal, escaping backslashes and double quotes."""  # noqa: E501
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _is_upstream_failure(error: RequestException) -> bool:
+    """Returns True if `error` means Jira is unreachable, overloaded or rate-limited."""  # noqa: E501
+    if isinstance(error, HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+        return status == 429 or status >= 500
+    return isinstance(error, (ConnectionError, Timeout, RetryError))
+
+
+def _params_key(params: Dict[str, Any] = None) -> tuple:
+    """Converts a params dict into a sorted tuple that is cheap to hash as a cache key."""  # noqa: E501
+    return tuple(sorted((params or {}).items()))
 
 
 class JiraConnection(ExperimentalBaseConnection[requests.Session]):
@@ -43,7 +309,8 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
             **kwargs: Additional keyword arguments.
 
         Returns:
-            Session: A new requests.Session object with authentication credentials.
+            Session: The shared requests.Session for this base URL and user, cached with
+                     `st.cache_resource` so it is reused across users, sessions and reruns.
 
         Raises:
             ValueError: If invalid or missing credentials are provided.
@@ -59,9 +326,7 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
         username = credentials["username"]
         password = credentials["password"]
         if credentials and username and password:
-            session = requests.Session()
-            session.auth = (username, password)
-            return session
+            return _build_session(self.base_url, username, password)
         else:
             raise ValueError("ERROR: Invalid or missing credentials")
 
@@ -69,17 +334,91 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
         """
         Returns the underlying requests.Session object used for making API requests.
 
+        The session is a shared singleton (see `_build_session`), so the same object
+        is returned to every connection using the same base URL and credentials.
+
         Returns:
             Session: The underlying requests.Session object.
 
         Example:
             # Getting the cursor to make direct API requests
             session = jira_connection.cursor()
-        """
+        """  # noqa: E501
         return self._instance
 
+    def close(self):
+        """
+        Clears every cached session from the resource cache and resets this connection.
+
+        This is a process-wide teardown: sessions for all base URLs and users are dropped
+        from the cache, so later connections build new ones. Sessions already held by
+        other live connections are not closed and keep working until they reset.
+
+        Example:
+            # Tearing down the connection
+            jira_connection.close()
+        """  # noqa: E501
+        _build_session.clear()
+        self.reset()
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any] = None,
+        payload: Dict[str, Any] = None,
+        ttl=TTL_NORMAL,
+    ) -> Any:
+        """
+        Sends a request through the response cache, or directly when `ttl` is 0.
+
+        With `ttl=0` the result would be evicted immediately, so the cache is
+        skipped entirely to avoid hashing and storing the response for nothing.
+        `ttl=None` is passed through to `st.cache_data` and never expires.
+        Otherwise `ttl` is extended for slow endpoints (see `_adaptive_ttl`).
+
+        If Jira is unreachable, overloaded or rate-limited, the last successful
+        response for the same request is returned instead, with a toast warning.
+        """
+        # Build the cache keys once so Streamlit hashes flat values, not nested dicts
+        params_key = _params_key(params)
+        key = _request_key(method, url, params, payload)
+        payload_key = key[-1]
+        # Responses differ per user, so cached and stale copies are kept per user
+        username = self.cursor().auth[0]
+        stale_key = (username, *key)
+        try:
+            if ttl == 0:
+                fetched_at = time.time()
+                data = _send(self.cursor(), method, url, params, payload)
+            else:
+                ttl = _adaptive_ttl(key, ttl)
+                fetched_at, data = _cached_send(ttl)(
+                    self.cursor(),
+                    username,
+                    method,
+                    url,
+                    params_key,
+                    payload_key,
+                    payload,
+                )
+        except RequestException as e:
+            if not _is_upstream_failure(e):
+                raise
+            with _stale_lock:
+                stale = _stale.get(stale_key)
+            if stale is None:
+                raise
+            fetched_at, content = stale
+            age = int(time.time() - fetched_at)
+            st.toast(f"Serving stale data from {age}s ago: Jira unreachable")
+            return orjson.loads(content)
+        stale = (fetched_at, orjson.dumps(data))
+        _lru_set(_stale, _stale_lock, stale_key, stale, STALE_MAX_ENTRIES)
+        return data
+
     def query(
-        self, endpoint: str, params: Dict[str, Any] = None, ttl=600, **kwargs
+        self, endpoint: str, params: Dict[str, Any] = None, ttl=TTL_NORMAL, **kwargs
     ) -> List[Dict[str, Any]]:
         """
         Executes an API GET request to the specified Jira endpoint.
@@ -87,7 +426,7 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
         Parameters:
             endpoint (str): The API endpoint to be appended to the base URL.
             params (Dict[str, Any], optional): Query parameters to be sent with the request.
-            ttl (int, optional): Time to live in seconds for caching the response (default: 600 seconds).
+            ttl (int, optional): Time to live in seconds for caching the response, 0 disables caching (default: TTL_NORMAL, 30 seconds).
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -97,25 +436,17 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
             # Querying the Jira API for all projects
             projects = jira_connection.query(endpoint="/rest/api/3/project")
         """  # noqa: E501
-
-        @st.cache_data(ttl=ttl)
-        def _query(endpoint: str, params: Dict[str, Any] = None, **kwargs):
-            url = self.base_url + endpoint
-            response = self.cursor().get(url, params=params)
-            response.raise_for_status()  # Raise an error if the request fails
-            return response.json()
-
-        return _query(endpoint, params, **kwargs)
+        return self._fetch("GET", self.base_url + endpoint, params, ttl=ttl)
 
     def query_projects(
-        self, params: Dict[str, Any] = None, ttl=600, **kwargs
+        self, params: Dict[str, Any] = None, ttl=TTL_LONG, **kwargs
     ) -> List[Dict[str, Any]]:
         """
         Retrieves a list of Jira projects using the 'query' method.
 
         Parameters:
             params (Dict[str, Any], optional): Query parameters to be sent with the request.
-            ttl (int, optional): Time to live in seconds for caching the response (default: 600 seconds).
+            ttl (int, optional): Time to live in seconds for caching the response, 0 disables caching (default: TTL_LONG, 3600 seconds).
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -125,18 +456,16 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
             # Querying Jira API for all projects
             projects = jira_connection.query_projects()
         """  # noqa: E501
-
-        @st.cache_data(ttl=ttl)
-        def _query(params: Dict[str, Any] = None, **kwargs):
-            url = self.base_url + "/rest/api/3/project"
-            response = self.cursor().get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-
-        return _query(params, **kwargs)
+        url = self.base_url + "/rest/api/3/project"
+        return self._fetch("GET", url, params, ttl=ttl)
 
     def query_issue(
-        self, issue_id: str, params: Dict[str, Any] = None, ttl=600, **kwargs
+        self,
+        issue_id: str,
+        params: Dict[str, Any] = None,
+        ttl=TTL_SHORT,
+        fields=("summary", "status", "assignee"),
+        **kwargs,
     ):
         """
         Retrieves information about a specific Jira issue using the 'query' method.
@@ -144,7 +473,8 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
         Parameters:
             issue_id (str): The ID of the Jira issue to retrieve information about.
             params (Dict[str, Any], optional): Query parameters to be sent with the request.
-            ttl (int, optional): Time to live in seconds for caching the response (default: 600 seconds).
+            ttl (int, optional): Time to live in seconds for caching the response, 0 disables caching (default: TTL_SHORT, 10 seconds).
+            fields (List[str], optional): The issue fields to retrieve, None retrieves all fields (default: ("summary", "status", "assignee")).
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -155,29 +485,71 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
             issue_id = "ISSUE-123"
             issue_data = jira_connection.query_issue(issue_id)
         """  # noqa: E501
+        url = self.base_url + "/rest/api/3/issue/" + issue_id
+        if fields:
+            params = {**(params or {}), "fields": ",".join(fields)}
+        try:
+            # Errors are raised out of the cached function so they are never cached
+            return self._fetch("GET", url, params, ttl=ttl)
+        except HTTPError as e:  # noqa: F841
+            # Handle the 404 error or other HTTP errors
+            return None
+
+    def query_issues(
+        self,
+        issue_ids: List[str],
+        ttl=TTL_SHORT,
+        fields=("summary", "status", "assignee"),
+        **kwargs,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieves several Jira issues with a single JQL search instead of one request per issue.
 
-        @st.cache_data(ttl=ttl)
-        def _query(params: Dict[str, Any] = None, **kwargs):
-            url = self.base_url + "/rest/api/3/issue/" + issue_id
-            try:
-                response = self.cursor().get(url, params=params)
-                response.raise_for_status()
-                return response.json()
-            except HTTPError as e:  # noqa: F841
-                # Handle the 404 error or other HTTP errors
-                return None
+        Parameters:
+            issue_ids (List[str]): The IDs of the Jira issues to retrieve.
+            ttl (int, optional): Time to live in seconds for caching the response, 0 disables caching (default: TTL_SHORT, 10 seconds).
+            fields (List[str], optional): The issue fields to retrieve (default: ("summary", "status", "assignee")).
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The issue dictionaries keyed by issue key. Issues that do not exist are left out.
+
+        Raises:
+            HTTPError: If a search request fails. Unknown issue keys do not fail the search.
 
-        return _query(params, **kwargs)
+        Example:
+            # Querying Jira API for several issues at once
+            issues = jira_connection.query_issues(["ISSUE-123", "ISSUE-124"])
+        """  # noqa: E501
+        url = self.base_url + "/rest/api/3/search"
+        issues = {}
+        # Jira caps a search page at 100 issues
+        for i in range(0, len(issue_ids), 100):
+            chunk = issue_ids[i : i + 100]
+            keys = ",".join(_jql_string(issue_id) for issue_id in chunk)
+            payload = {
+                "fields": list(fields),
+                "jql": f"issuekey in ({keys})",
+                "maxResults": len(chunk),
+                # Skip unknown keys instead of failing the whole search
+                "validateQuery": "warn",
+            }
+            data = self._fetch("POST", url, payload=payload, ttl=ttl)
+            for issue in data["issues"]:
+                issues[issue["key"]] = issue
+        return issues
 
     def query_jql(
         self,
         jql_query: str,
-        ttl: int = 600,
-        expand=["changelog"],
+        ttl: int = TTL_NORMAL,
+        expand=[],
         fields=["summary", "status"],
         max_results=10,
         start_at=0,
         return_type="count",
+        fetch_all=False,
+        page_size=100,
         **kwargs,
     ) -> List[Dict[str, Union[str, int]]]:
         """
@@ -185,13 +557,15 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
 
         Parameters:
             jql_query (str): The JQL query string to be executed.
-            ttl (int, optional): Time to live in seconds for caching the response (default: 600 seconds).
-            expand (List[str], optional): A list of fields to expand in the Jira issue (default: ["changelog"]).
+            ttl (int, optional): Time to live in seconds for caching the response, 0 disables caching (default: TTL_NORMAL, 30 seconds).
+            expand (List[str], optional): A list of fields to expand in the Jira issue (default: []).
             fields (List[str], optional): A list of fields to include in the search results (default: ["summary", "status"]).
             max_results (int, optional): The maximum number of results to retrieve (default: 10).
             start_at (int, optional): The index of the first result to retrieve (default: 0).
+            fetch_all (bool, optional): Whether to page through all matching issues instead of returning a single page of 'max_results' (default: False).
+            page_size (int, optional): The number of issues to request per page when 'fetch_all' is set (default: 100).
             return_type (str, optional): The type of data to return. Possible values are "count" (returns the total number of issues matching the query),
-                                         "json" (returns a list of issue dictionaries), and "dataframe" (returns a Pandas DataFrame of the issues) (default: "count").
+                                         "json" (returns a list of issue dictionaries), and "dataframe" (returns a Pandas DataFrame with a "key" column and one column per requested field) (default: "count").
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -208,38 +582,103 @@ class JiraConnection(ExperimentalBaseConnection[requests.Session]):
         if not jql_query:
             raise ValueError("ERROR: 'jql_query' is required")
 
-        @st.cache_data(ttl=ttl)
-        def _query(jql_query: str, **kwargs):
-            payload = json.dumps(
-                {
-                    "expand": expand,
-                    "fields": fields,
-                    "fieldsByKeys": False,
-                    "jql": jql_query,
-                    "maxResults": max_results,
-                    "startAt": start_at,
-                }
-            )
-            try:
-                response = self.cursor().post(
-                    self.base_url + "/rest/api/3/search",
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
+        try:
+            if return_type == "count":
+                return self._search(
+                    jql_query, start_at, max_results, expand, fields, ttl
+                )["total"]
+            elif fetch_all:
+                issues = self.iter_jql(
+                    jql_query, ttl, expand, fields, page_size, start_at
                 )
-                response.raise_for_status()  # Raise an exception for non-2xx responses
-                data = response.json()
-                return data
-            except HTTPError as e:
-                # Handle the 404 error or other HTTP errors
-                return {"error": f"HTTP Error: {e}"}
-
-        if return_type == "count":
-            return _query(jql_query, **kwargs)["total"]
-        elif return_type == "json":
-            return _query(jql_query, **kwargs)["issues"]
-        elif return_type == "dataframe":
-            issues = _query(jql_query, **kwargs)["issues"]
-            df = pd.json_normalize(issues)
-            return df
-        else:
-            return {"error": "Invalid return_type"}
+            else:
+                issues = self._search(
+                    jql_query, start_at, max_results, expand, fields, ttl
+                )["issues"]
+
+            if return_type == "json":
+                return list(issues)
+            elif return_type == "dataframe":
+                # Stream issues into per-column lists instead of normalizing every key
+                columns = {"key": [], **{field: [] for field in fields}}
+                for issue in issues:
+                    columns["key"].append(issue["key"])
+                    for field in fields:
+                        columns[field].append(_field_value(issue["fields"].get(field)))
+                df = pd.DataFrame(columns)
+                return df
+            else:
+                return {"error": "Invalid return_type"}
+        except HTTPError as e:
+            # Handle the 404 error or other HTTP errors
+            return {"error": f"HTTP Error: {e}"}
+
+    def iter_jql(
+        self,
+        jql_query: str,
+        ttl: int = TTL_NORMAL,
+        expand=[],
+        fields=["summary", "status"],
+        page_size=100,
+        start_at=0,
+        **kwargs,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Executes a Jira Query Language (JQL) query and yields matching issues one page at a time.
+
+        Only one page of issues is held in memory at once. Each page is cached on its own,
+        keyed by the query, 'start_at' and 'page_size'.
+
+        Parameters:
+            jql_query (str): The JQL query string to be executed.
+            ttl (int, optional): Time to live in seconds for caching each page, 0 disables caching (default: TTL_NORMAL, 30 seconds).
+            expand (List[str], optional): A list of fields to expand in the Jira issue (default: []).
+            fields (List[str], optional): A list of fields to include in the search results (default: ["summary", "status"]).
+            page_size (int, optional): The number of issues to request per page (default: 100).
+            start_at (int, optional): The index of the first result to retrieve (default: 0).
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator over the issue dictionaries matching the query.
+
+        Raises:
+            ValueError: If 'jql_query' is empty or not provided (raised on call, not on iteration).
+            HTTPError: If a page request fails (raised during iteration).
+
+        Example:
+            # Iterating over all issues in a project
+            for issue in jira_connection.iter_jql('project = "MYPROJECT"'):
+                st.write(issue["key"])
+        """  # noqa: E501
+        if not jql_query:
+            raise ValueError("ERROR: 'jql_query' is required")
+
+        # Validate above before returning the generator, so errors raise on call
+        return self._iter_pages(jql_query, ttl, expand, fields, page_size, start_at)
+
+    def _iter_pages(
+        self, jql_query: str, ttl, expand, fields, page_size, start_at
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields issues from consecutive JQL search pages until 'total' is reached."""  # noqa: E501
+        start = start_at
+        while True:
+            page = self._search(jql_query, start, page_size, expand, fields, ttl)
+            yield from page["issues"]
+            start += len(page["issues"])
+            if not page["issues"] or start >= page["total"]:
+                break
+
+    def _search(
+        self, jql_query: str, start_at: int, max_results: int, expand, fields, ttl
+    ) -> Dict[str, Any]:
+        """Fetches a single page of JQL search results."""
+        payload = {
+            "expand": expand,
+            "fields": fields,
+            "fieldsByKeys": False,
+            "jql": jql_query,
+            "maxResults": max_results,
+            "startAt": start_at,
+        }
+        url = self.base_url + "/rest/api/3/search"
+        return self._fetch("POST", url, payload=payload, ttl=ttl)
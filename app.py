@@ -1,5 +1,8 @@
 import streamlit as st
-from JiraConnection import JiraConnection
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from requests.exceptions import HTTPError
+from JiraConnection import JiraConnection, TTL_NORMAL, TTL_SHORT
 import plotly.express as px
 
 
@@ -14,6 +17,19 @@ conn = st.experimental_connection(
     "jira", type=JiraConnection, base_url="https://sam1120.atlassian.net"
 )
 
+
+def issue_row(issue):
+    summary = issue["fields"]["summary"]
+    if issue["fields"]["assignee"]:
+        assignee = issue["fields"]["assignee"]["displayName"]
+    else:
+        # Handle the case when the issue has no assignee.
+        assignee = "Unassigned"  # Or any default value that suits your application.  # noqa: E501
+
+    status = issue["fields"]["status"]["name"]
+    return {"summary": summary, "assignee": assignee, "status": status}
+
+
 with tab1:
     st.title("Jira Dashboard")
     st.markdown("### Single Issue view")
@@ -23,56 +39,80 @@ with tab1:
         issue_id = st.text_input(
             "Enter an issue ID",
             "test-1",
-            help="Enter an issue ID, try test-5 for example",
+            help="Enter an issue ID, or several separated by commas, try test-5 for example",  # noqa: E501
             placeholder="Enter an issue ID, try test-5 for example",
         )
         st.markdown(
-            "Try using `test-5`, `test-6`, `test-7` to test the Single issue view"
+            "Try using `test-5`, `test-6`, `test-7` (or `test-5, test-6`) to test the Single issue view"  # noqa: E501
         )
-    with col_detail:
-        if issue_id:
-            single_issue = conn.query_issue(f"{issue_id}", ttl=0)
-            if single_issue:
-                summary = single_issue["fields"]["summary"]
-                if single_issue["fields"]["assignee"]:
-                    assignee = single_issue["fields"]["assignee"]["displayName"]
-                else:
-                    # Handle the case when single_issue is None or the keys are missing.
-                    assignee = "Unassigned"  # Or any default value that suits your application.  # noqa: E501
+    issue_ids = [i.strip() for i in issue_id.split(",") if i.strip()]
 
-                status = single_issue["fields"]["status"]["name"]
-                st.dataframe(
-                    {"summary": summary, "assignee": assignee, "status": status},
-                    width=600,
-                )
-            else:
-                st.error("Issue not found")
-
-    results_df = conn.query_jql(
-        "created >= -30d order by created ASC",
-        return_type="dataframe",
-        fields=["summary", "status", "assignee"],
-        ttl=0,
-    )
-    if len(results_df) > 0:
-        issues = results_df[
-            [
-                "key",
-                "fields.summary",
-                "fields.status.name",
-                "fields.assignee.displayName",
-            ]
-        ].rename(
-            columns={
-                "fields.summary": "summary",
-                "fields.status.name": "status",
-                "fields.assignee.displayName": "assignee",
-            }
+    # The issue lookup and the JQL search are independent, so run them in parallel
+    with ThreadPoolExecutor(
+        max_workers=2,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        if len(issue_ids) > 1:
+            # Fetch all issues with a single search instead of one request each
+            future_issue = executor.submit(
+                conn.query_issues, issue_ids, ttl=TTL_SHORT
+            )
+        elif issue_ids:
+            future_issue = executor.submit(
+                conn.query_issue,
+                issue_ids[0],
+                ttl=TTL_SHORT,
+                fields=["summary", "status", "assignee"],
+            )
+        future_jql = executor.submit(
+            conn.query_jql,
+            "created >= -30d order by created ASC",
+            return_type="dataframe",
+            fields=["summary", "status", "assignee"],
+            ttl=TTL_NORMAL,
+            fetch_all=True,
         )
 
+        with col_detail:
+            if len(issue_ids) > 1:
+                try:
+                    found = future_issue.result()
+                except HTTPError as e:
+                    found = None
+                    st.error(f"HTTP Error: {e}")
+                if found:
+                    st.dataframe(
+                        [
+                            {"key": key, **issue_row(issue)}
+                            for key, issue in found.items()
+                        ],
+                        width=600,
+                    )
+                elif found is not None:
+                    st.error("Issues not found")
+            elif issue_ids:
+                single_issue = future_issue.result()
+                if single_issue:
+                    st.dataframe(issue_row(single_issue), width=600)
+                else:
+                    st.error("Issue not found")
+
+        results_df = future_jql.result()
+
+    if isinstance(results_df, dict):
+        # query_jql returns {"error": ...} instead of a DataFrame on failure
+        st.error(results_df["error"])
+    elif len(results_df) > 0:
+        issues = results_df[["key", "summary", "status", "assignee"]]
+
         status_count = (
-            issues.groupby("status").count().reset_index().drop("summary", axis=1)
+            issues["status"]
+            .value_counts()
+            .rename_axis("status")
+            .reset_index(name="key")
         )
+        counts = dict(zip(status_count["status"], status_count["key"].astype(int)))
         st.write("----")
         # Display the results
         st.markdown("### Key Metrics based on the JQL using `JiraConnection.query_jql`")
@@ -80,17 +120,9 @@ with tab1:
         with col1:
             st.metric(label="Total Issues", value=issues.shape[0])
         with col2:
-            st.metric(
-                label="Completed",
-                value=status_count[status_count["status"] == "Done"]["key"].values[0],
-            )
+            st.metric(label="Completed", value=counts.get("Done", 0))
         with col3:
-            st.metric(
-                label="In Progress",
-                value=status_count[status_count["status"] == "In Progress"][
-                    "key"
-                ].values[0],
-            )
+            st.metric(label="In Progress", value=counts.get("In Progress", 0))
 
         col5, col6 = st.columns(2, gap="medium")
 